@@ -1,4 +1,4 @@
-from copy import copy, deepcopy
+from copy import copy
 from unittest.mock import create_autospec, MagicMock
 from functools import wraps
 from typing import Type, Set, Union, Dict, TypeVar
@@ -22,6 +22,17 @@ class _LocalStorage(threading.local):
         self.current_env: Context = None
 
 
+_local_storage = _LocalStorage()
+
+
+def current_context() -> 'Context':
+    env = _local_storage.current_env
+    if env is None:
+        env = Context()
+        _local_storage.current_env = env
+    return env
+
+
 class _ContextState(threading.local):
     def __init__(self):
         self.pending: Set[Type[object]] = set()
@@ -29,14 +40,17 @@ class _ContextState(threading.local):
         self.mocks: Dict[Union[str, Type[object]], MagicMock] = dict()
         self.singletons: Dict[Type[T], T] = dict()
 
-    def __deepcopy__(self, memodict):
+    def copy(self) -> '_ContextState':
         new = _ContextState()
         new.pending = copy(self.pending)
         new.old_current = copy(self.old_current)
         new.mocks = copy(self.mocks)
-        new.singletons = copy(self.mocks)
+        new.singletons = {}
         return new
 
+    def __deepcopy__(self, memodict):
+        return self.copy()
+
 
 class Context:
     """
@@ -50,30 +64,22 @@ class Context:
     def fun():
         NeedsDependency()
     """
-    __local_storage = _LocalStorage()
-
-    @staticmethod
-    def current_context() -> 'Context':
-        env = Context.__local_storage.current_env
-        if env is None:
-            env = Context()
-            Context._set_current_env(env)
-        return env
+    current_context = staticmethod(current_context)
 
     @staticmethod
     def mock(dependency: Union[str, Type[object]]):
-        current_env = Context.current_context()
-        if isinstance(dependency, str):
+        current_env = current_context()
+        if isinstance(dependency, type):
+            mock = create_autospec(dependency, instance=True)
+        else:
             value = current_env[dependency]
             mock = create_autospec(value)
-        else:
-            mock = create_autospec(dependency, instance=True)
         current_env.__state.mocks[dependency] = mock
         return mock
 
     @staticmethod
     def _set_current_env(env: 'Context'):
-        Context.__local_storage.current_env = env
+        _local_storage.current_env = env
 
     def __init__(self, *args: Type[object], **kwargs: object) -> None:
         """
@@ -82,6 +88,7 @@ class Context:
         :param kwargs: Named dependencies to provide in this context
         """
         self.__registry: Set[Type[object]] = set()
+        self.__subtypes: Dict[Type[object], Union[Type[object], None]] = {}
         self.__state: _ContextState = _ContextState()
         self.__named_dependencies = kwargs
         self.__old_current = None
@@ -113,6 +120,9 @@ class Context:
     def is_mocked(self, component: Union[str, Type[object]]) -> bool:
         return component in self.__state.mocks
 
+    def has_named_dependencies(self) -> bool:
+        return bool(self.__named_dependencies)
+
     def __use(self, component: Type[object]) -> 'Context':
         self.__registry.add(component)
         return self
@@ -162,7 +172,7 @@ class Context:
         Register this context as the current environment in this thread
         :return:
         """
-        self.__old_current = Context.current_context()
+        self.__old_current = current_context()
         old_state = self.__old_current.__copy_state()
         self.__set_state(old_state)
         Context._set_current_env(self)
@@ -172,7 +182,7 @@ class Context:
         self.__state = state
 
     def __copy_state(self):
-        return deepcopy(self.__state)
+        return self.__state.copy()
 
     def has_singleton_instance(self, singleton_type):
         return singleton_type in self.__state.singletons
@@ -197,7 +207,7 @@ class Context:
         :return: Instance of the most specific subtype of component
                  in this environment
         """
-        context = Context.current_context()
+        context = current_context()
 
         def singleton(singleton_type: Type[T]) -> T:
             if context.has_singleton_instance(singleton_type):
@@ -214,9 +224,6 @@ class Context:
             component_instance = component_type()
             return component_instance
 
-        def is_singleton(st):
-            return hasattr(st, '__singleton__')
-
         def instantiate(dependency_type: Type[T]) -> T:
             if dependency_type in context.pending:
                 raise CircularDependency(
@@ -226,7 +233,7 @@ class Context:
                 )
             context.pending.add(dependency_type)
             try:
-                if is_singleton(dependency_type):
+                if getattr(dependency_type, '__singleton__', False):
                     component_instance = singleton(dependency_type)
                 else:
                     component_instance = instance(dependency_type)
@@ -250,12 +257,20 @@ class Context:
 
     @staticmethod
     def find_subtype(component: Type[T]) -> Union[Type[T], None]:
+        context = current_context()
+        try:
+            return context.__subtypes[component]
+        except KeyError:
+            subtype = context.__find_subtype(component)
+            context.__subtypes[component] = subtype
+            return subtype
+
+    def __find_subtype(self, component: Type[T]) -> Union[Type[T], None]:
         def mro_distance(subtype: Type[T]) -> int:
             mro = inspect.getmro(subtype)
             return mro.index(component)
 
-        subtypes = [c for c in Context.current_context()
-                    if issubclass(c, component)]
+        subtypes = [c for c in self if issubclass(c, component)]
         distances = [mro_distance(subtype) for subtype in subtypes]
         counter = Counter(distances)
         if any(count > 1 for count in counter.values()):
@@ -291,9 +306,5 @@ __all__ = ['Context']
 
 def provide(configuration: DependencyConfiguration):
     if isinstance(configuration.dependency, Key):
-        return Context.current_context()[configuration.name]
+        return current_context()[configuration.name]
     return Context.provide(configuration)
-
-
-def current_context():
-    return Context.current_context()
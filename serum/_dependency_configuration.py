@@ -1,4 +1,6 @@
 class DependencyConfiguration:
+    __slots__ = ('dependency', 'name', 'owner')
+
     def __init__(self, dependency, name, owner):
         self.dependency = dependency
         self.name = name
@@ -1,15 +1,17 @@
 import inspect
+import threading
 from typing import TypeVar
 
-from functools import wraps
+from functools import wraps, WRAPPER_ASSIGNMENTS
 
 from serum._dependency_configuration import DependencyConfiguration
 from serum.exceptions import InjectionError
 from ._key import Key
-from ._context import provide, current_context
+from ._context import Context, provide, current_context
 from ._injected_dependency import Dependency as InjectedDependency
 
 T = TypeVar('T')
+_MISSING = object()
 
 
 def __format_name(cls, name):
@@ -21,10 +23,20 @@ def __is_dependency_decorated(dependency):
     return is_dependency
 
 
-def __set_dependency(configuration: DependencyConfiguration, kwargs, name):
-    if configuration.name in kwargs:
-        setattr(configuration.owner, name, kwargs[configuration.name])
-        del kwargs[configuration.name]
+def __is_set(instance, name):
+    # Unlike hasattr, this neither falls back to a class's own __getattr__
+    # nor assumes the instance has a __dict__
+    try:
+        object.__getattribute__(instance, name)
+    except AttributeError:
+        return False
+    return True
+
+
+def __set_dependency(configuration: DependencyConfiguration, kw_pop, name):
+    value = kw_pop(configuration.name, _MISSING)
+    if value is not _MISSING:
+        setattr(configuration.owner, name, value)
     else:
         try:
             instance = provide(configuration)
@@ -39,109 +51,201 @@ def __set_dependency(configuration: DependencyConfiguration, kwargs, name):
             ) from e
 
 
-def _set_base_dependencies(bases, kwargs, self):
+def __collect_base_dependencies(bases):
+    dependencies = []
     for base in bases:
         if hasattr(base, '__dependencies__'):
-            for annotated_name, name, dependency in base.__dependencies__:
-                if hasattr(self, name):
-                    # if 'self' already has 'name', then it was overwritten
-                    # and should not be reset with a type from
-                    # a base class
-                    continue
-                configuration = DependencyConfiguration(
-                    dependency=dependency,
-                    name=annotated_name,
-                    owner=self
-                )
-                __set_dependency(
-                    configuration,
-                    kwargs,
-                    name,
-                )
-        _set_base_dependencies(base.__bases__, kwargs, self)
-
-
-def __decorate_init(init):
-    @wraps(init)
-    def decorator(self, *args, **kwargs):
-        for annotated_name, name, dependency in self.__dependencies__:
-            configuration = DependencyConfiguration(
-                dependency=dependency,
-                name=annotated_name,
-                owner=self
-            )
-            __set_dependency(configuration, kwargs, name)
-        bases = self.__class__.__bases__
-        _set_base_dependencies(bases, kwargs, self)
-        return init(self, *args, **kwargs)
+            dependencies.extend(base.__dependencies__)
+        dependencies.extend(__collect_base_dependencies(base.__bases__))
+    return dependencies
+
+
+def __base_dependencies(cls):
+    # computed once per class and stored on the class itself, since
+    # 'self.__class__' may be an undecorated subclass
+    try:
+        return cls.__dict__['__base_dependencies__']
+    except KeyError:
+        dependencies = tuple(__collect_base_dependencies(cls.__bases__))
+        cls.__base_dependencies__ = dependencies
+        return dependencies
+
+
+def _set_base_dependencies(cls, kw_pop, self):
+    for annotated_name, name, dependency in __base_dependencies(cls):
+        if hasattr(self, name):
+            # if 'self' already has 'name', then it was overwritten
+            # and should not be reset with a type from
+            # a base class
+            continue
+        configuration = DependencyConfiguration(
+            dependency=dependency,
+            name=annotated_name,
+            owner=self
+        )
+        __set_dependency(
+            configuration,
+            kw_pop,
+            name,
+        )
+
+
+def __copy_assignments(wrapped, wrapper):
+    # Like functools.wraps, but without __dict__ and __wrapped__, so
+    # introspection of the generated __init__ doesn't recurse
+    for attribute in WRAPPER_ASSIGNMENTS:
+        try:
+            value = getattr(wrapped, attribute)
+        except AttributeError:
+            continue
+        setattr(wrapper, attribute, value)
+
+
+# 'self' may already have the attribute if a decorated subclass set it
+# while walking its base classes, in which case it is not provided again
+_SET_DEPENDENCY_SOURCE = """
+    value = kw_pop({annotated_name!r}, _MISSING)
+    if value is not _MISSING:
+        setattr(self, {name!r}, value)
+    elif not _is_set(self, {name!r}):
+        try:
+            value = {resolve}
+        except Exception as e:
+            value = e
+        try:
+            setattr(self, {name!r}, value)
+        except Exception as e:
+            raise _InjectionError(
+                f'Could not set attribute {annotated_name} on {{self}}'
+            ) from e"""
+
+
+def __decorate_init(cls, init):
+    # Generate an __init__ that sets each dependency of 'cls' inline,
+    # so construction doesn't loop over 'cls.__dependencies__'
+    namespace = dict(
+        _MISSING=_MISSING,
+        _InjectionError=InjectionError,
+        _Configuration=DependencyConfiguration,
+        _provide=Context.provide,
+        _current_context=current_context,
+        _set_base_dependencies=_set_base_dependencies,
+        _is_set=__is_set,
+        _init=init,
+    )
+    lines = [
+        'def __init__(self, *args, **kwargs):',
+        '    kw_pop = kwargs.pop',
+    ]
+    for i, (annotated_name, name, dependency) in enumerate(
+            cls.__dependencies__):
+        # resolve named dependencies straight from the context
+        # instead of dispatching on the dependency type for every instance
+        if isinstance(dependency, Key):
+            resolve = f'_current_context()[{annotated_name!r}]'
+        else:
+            namespace[f'_dependency_{i}'] = dependency
+            resolve = (f'_provide(_Configuration('
+                       f'_dependency_{i}, {annotated_name!r}, self))')
+        lines.append(_SET_DEPENDENCY_SOURCE.format(
+            annotated_name=annotated_name,
+            name=name,
+            resolve=resolve
+        ))
+    lines += [
+        '    _set_base_dependencies(self.__class__, kw_pop, self)',
+        '    return _init(self, *args, **kwargs)',
+    ]
+    source = '\n'.join(lines)
+    exec(compile(source, f'<inject {cls.__qualname__}>', 'exec'), namespace)
+    decorator = namespace['__init__']
+    __copy_assignments(init, decorator)
     return decorator
 
 
+def __lazy_init(cls, init):
+    # Generating the specialized __init__ is deferred to the first
+    # instantiation, so decorating classes that are never instantiated
+    # stays cheap
+    lock = threading.Lock()
+    generated = None
+
+    def __init__(self, *args, **kwargs):
+        nonlocal generated
+        # decorated subclasses keep calling this placeholder as their
+        # base __init__, so the lock is only taken until it is generated
+        if generated is None:
+            with lock:
+                if generated is None:
+                    generated = __decorate_init(cls, init)
+                    cls.__init__ = generated
+        return generated(self, *args, **kwargs)
+    __copy_assignments(init, __init__)
+    return __init__
+
+
 def _decorate_class(cls):
-    if not hasattr(cls, '__annotations__'):
+    if not getattr(cls, '__annotations__', None):
         return cls
     dependencies = []
     for name, dependency in cls.__annotations__.items():
-        if __is_dependency_decorated(dependency):
-            formatted_name = __format_name(cls, name)
-            dependencies.append((name, formatted_name, dependency))
-            setattr(cls, name, InjectedDependency(formatted_name))
-        else:
-            formatted_name = __format_name(cls, name)
-            key = Key(name=name, dependency_type=dependency)
-            dependencies.append((name, formatted_name, key))
-            setattr(cls, name, InjectedDependency(formatted_name))
-    cls.__dependencies__ = dependencies
-    cls.__init__ = __decorate_init(cls.__init__)
+        formatted_name = __format_name(cls, name)
+        if not __is_dependency_decorated(dependency):
+            dependency = Key(name=name, dependency_type=dependency)
+        dependencies.append((name, formatted_name, dependency))
+        setattr(cls, name, InjectedDependency(formatted_name))
+    cls.__dependencies__ = tuple(dependencies)
+    cls.__init__ = __lazy_init(cls, cls.__init__)
     return cls
 
 
 def _decorate_function(f):
-    signature = inspect.signature(f)
-    names = signature.parameters.keys()
+    parameters = inspect.signature(f).parameters
+    if not parameters:
+        return f
+    names = tuple(parameters)
+    if any(parameter.kind in (parameter.VAR_POSITIONAL,
+                              parameter.VAR_KEYWORD)
+           for parameter in parameters.values()):
+        arity = None
+    else:
+        # a call with this many arguments leaves nothing to inject
+        arity = len(names)
+    # annotations that aren't @dependency types are looked up by name
+    # directly in the context, so they need no configuration
+    annotated = tuple(
+        (name, DependencyConfiguration(
+            dependency=dependency,
+            name=name,
+            owner=f
+        ) if __is_dependency_decorated(dependency) else None)
+        for name, dependency in f.__annotations__.items()
+        if name != 'return'
+    )
 
     @wraps(f)
     def decorator(*args, **kwargs):
-        positional_names = {name for name, arg in zip(names, args)}
-        dependency_args = kwargs
-        annotations = f.__annotations__
-        annotations.pop('return', None)
-        for name, dependency in annotations.items():
-            if name in dependency_args or name in positional_names:
+        if arity is not None and len(args) + len(kwargs) >= arity:
+            return f(*args, **kwargs)
+        context = current_context()
+        has_named_dependencies = context.has_named_dependencies()
+        positional_names = set(names[:len(args)])
+        dependency_args = {}
+        for name, configuration in annotated:
+            if name in kwargs or name in positional_names:
                 continue
-            if __is_dependency_decorated(dependency):
-                configuration = DependencyConfiguration(
-                    dependency=dependency,
-                    name=name,
-                    owner=f
-                )
-                dependency_args[name] = provide(configuration)
-            elif name in current_context():
-                key = Key(
-                    dependency_type=dependency,
-                    name=name
-                )
-                configuration = DependencyConfiguration(
-                    dependency=key,
-                    name=name,
-                    owner=f
-                )
-                dependency_args[name] = provide(configuration)
-        for name in names:
-            if (name in current_context() and
-                    name not in dependency_args and
-                    name not in positional_names):
-                key = Key(
-                    dependency_type=object,
-                    name=name
-                )
-                configuration = DependencyConfiguration(
-                    dependency=key,
-                    name=name,
-                    owner=f
-                )
-                dependency_args[name] = provide(configuration)
-        return f(*args, **dependency_args)
+            if configuration is not None:
+                dependency_args[name] = Context.provide(configuration)
+            elif has_named_dependencies and name in context:
+                dependency_args[name] = context[name]
+        if has_named_dependencies:
+            for name in names:
+                if (name in context and
+                        name not in kwargs and
+                        name not in dependency_args and
+                        name not in positional_names):
+                    dependency_args[name] = context[name]
+        return f(*args, **kwargs, **dependency_args)
     decorator.__is_inject__ = True
     return decorator
 
@@ -3,6 +3,8 @@ class Dependency:
     Dependency descriptor for dependencies specified as class
     level annotations
     """
+    __slots__ = ('__name',)
+
     def __init__(self, name):
         self.__name = name
 
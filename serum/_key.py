@@ -1,6 +1,18 @@
-from typing import NamedTuple
+from operator import itemgetter
 
 
-class Key(NamedTuple):
-    dependency_type: type
-    name: str
+class Key(tuple):
+    __slots__ = ()
+
+    def __new__(cls, dependency_type: type, name: str) -> 'Key':
+        return tuple.__new__(cls, (dependency_type, name))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        return (f'Key(dependency_type={self.dependency_type!r}, '
+                f'name={self.name!r})')
+
+    dependency_type = property(itemgetter(0))
+    name = property(itemgetter(1))
@@ -1,7 +1,7 @@
 from setuptools import setup
-from scripts.release import read_version
 
-version = read_version('version.txt')
+with open('version.txt') as f:
+    version = f.read().strip()
 
 
 def readme():
@@ -21,6 +21,7 @@ setup(
     author_email='sd@dybro-debel.dk',
     python_requires='>=3.6',
     url='https://github.com/suned/serum',
+    download_url=f'https://github.com/suned/serum/archive/v{version}.tar.gz',
     keywords=['dependency-injection', 'solid', 'inversion-of-control'],
     classifiers=[],
 )
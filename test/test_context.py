@@ -4,6 +4,9 @@ from serum.exceptions import (
     AmbiguousDependencies,
     CircularDependency,
     NoNamedDependency)
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 import threading
 import pytest
 
@@ -13,11 +16,6 @@ class SomeComponent:
     pass
 
 
-@dependency
-class SomeOtherComponent:
-    pass
-
-
 @dependency
 class BaseDependency:
     pass
@@ -38,21 +36,16 @@ class SomeSingleton:
     pass
 
 
-class Key:
-    pass
-
-
-@inject
-class Dependent:
-    some_singleton: SomeSingleton
-    some_component: SomeComponent
+_SHARED_OWNER = object()
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
 
 
+@lru_cache(maxsize=None)
 def configuration(d):
     return DependencyConfiguration(
         name='test_name',
         dependency=d,
-        owner=object()
+        owner=_SHARED_OWNER
     )
 
 
@@ -74,15 +67,15 @@ def test_provides_concrete_subclass():
         assert isinstance(c, ConcreteComponent)
 
 
-def test_provides_correct_implementation():
-    with Context(ConcreteComponent):
+@pytest.mark.parametrize(
+    'component',
+    [ConcreteComponent, AlternativeComponent]
+)
+def test_provides_correct_implementation(component):
+    with Context(component):
         c = Context.provide(configuration(BaseDependency))
         assert isinstance(c, BaseDependency)
-        assert isinstance(c, ConcreteComponent)
-    with Context(AlternativeComponent):
-        c = Context.provide(configuration(BaseDependency))
-        assert isinstance(c, BaseDependency)
-        assert isinstance(c, AlternativeComponent)
+        assert isinstance(c, component)
 
 
 def test_intersection():
@@ -105,15 +98,23 @@ def test_decorater():
 
 
 def test_new_environment_in_thread():
+    entered = threading.Event()
+    released = threading.Event()
+
     def test():
         with Context(AlternativeComponent):
             c1 = Context.provide(configuration(BaseDependency))
             assert isinstance(c1, AlternativeComponent)
+            entered.set()
+            released.wait(timeout=5)
 
     with Context(ConcreteComponent):
-        threading.Thread(target=test).start()
+        future = _EXECUTOR.submit(test)
+        entered.wait(timeout=5)
         c2 = Context.provide(configuration(BaseDependency))
         assert isinstance(c2, ConcreteComponent)
+        released.set()
+        future.result(timeout=5)
 
 
 def test_same_context_in_thread():
@@ -123,7 +124,7 @@ def test_same_context_in_thread():
         assert e is not Context.current_context()
 
     with e:
-        threading.Thread(target=test).start()
+        _EXECUTOR.submit(test).result(timeout=5)
 
 
 def test_context_manager():
@@ -135,7 +136,8 @@ def test_context_manager():
 
 def test_missing_named_dependency():
     c = Context()
-    pytest.raises(NoNamedDependency, lambda: c['key'])
+    with pytest.raises(NoNamedDependency):
+        c['key']
 
 
 def test_getitem():
@@ -159,12 +161,27 @@ def test_fails_with_ambiguous_dependencies():
 
 
 def test_singleton_is_always_same_instance():
+    cfg = configuration(SomeSingleton)
     with Context():
-        s1 = Context.provide(configuration(SomeSingleton))
-        s2 = Context.provide(configuration(SomeSingleton))
+        s1 = Context.provide(cfg)
+        s2 = Context.provide(cfg)
         assert s1 is s2
 
 
+def test_singleton_is_not_shared_with_nested_context():
+    cfg = configuration(SomeSingleton)
+    s1 = Context.provide(cfg)
+    with Context():
+        s2 = Context.provide(cfg)
+    assert s1 is not s2
+
+
+def test_context_can_be_deep_copied():
+    context = deepcopy(Context(a=1))
+    assert repr(context) == 'Context(a=1)'
+    assert context['a'] == 1
+
+
 def test_circular_dependency():
     @dependency
     class AbstractA:
@@ -193,7 +210,11 @@ def test_circular_dependency():
         a: AbstractA
 
     with Context(A, B):
-        pytest.raises(CircularDependency, lambda: Dependent().a)
+        with pytest.raises(CircularDependency):
+            Dependent().a
+        # the cycle is gone once one side of it is mocked
+        Context.mock(AbstractB)
+        assert isinstance(Dependent().a, A)
 
 
 def test_subtype_is_singleton():
@@ -201,9 +222,10 @@ def test_subtype_is_singleton():
     class SomeComponentSingleton(SomeComponent):
         pass
 
+    cfg = configuration(SomeComponent)
     with Context(SomeComponentSingleton):
-        s1 = Context.provide(configuration(SomeComponent))
-        s2 = Context.provide(configuration(SomeComponent))
+        s1 = Context.provide(cfg)
+        s2 = Context.provide(cfg)
         assert s1 is s2
         s3 = Context.provide(configuration(SomeComponentSingleton))
         assert s1 is s3
@@ -1,3 +1,6 @@
+import sys
+import threading
+import time
 from abc import abstractmethod, ABC
 
 from serum import (
@@ -102,15 +105,15 @@ def test_inject_can_get_concrete_component():
         assert isinstance(d.abstract_dependency, ConcreteDependency)
 
 
-def test_inject_provides_correct_implementation():
-    with Context(ConcreteDependency):
-        d = AbstractDependent()
-        assert isinstance(d.abstract_dependency, AbstractDependency)
-        assert isinstance(d.abstract_dependency, ConcreteDependency)
-    with Context(AlternativeDependency):
+@pytest.mark.parametrize(
+    'dependency',
+    [ConcreteDependency, AlternativeDependency]
+)
+def test_inject_provides_correct_implementation(dependency):
+    with Context(dependency):
         d = AbstractDependent()
         assert isinstance(d.abstract_dependency, AbstractDependency)
-        assert isinstance(d.abstract_dependency, AlternativeDependency)
+        assert isinstance(d.abstract_dependency, dependency)
 
 
 def test_injection_chaining():
@@ -131,6 +134,15 @@ def test_named_dependency():
         assert NamedDependent().key == 'value'
 
 
+def test_named_dependency_in_base_class():
+    @inject
+    class C(NamedDependent):
+        some_dependency: SomeDependency
+
+    with Context(key='value'):
+        assert C().key == 'value'
+
+
 @Context(ConcreteDependency)
 def test_inheritance():
     assert isinstance(
@@ -153,6 +165,7 @@ def test_decorate_class_with_no_annotations():
 
     decorated = inject(NoAnnotations)
     assert decorated is NoAnnotations
+    assert '__init__' not in vars(NoAnnotations)
 
 
 def test_decorate_class_with_no_dependency_annotations():
@@ -208,37 +221,68 @@ def test_override_class_dependency():
     assert Dependent(some_dependency='test').some_dependency == 'test'
 
 
-def test_invalid_class_dependencies():
-    @dependency
-    class BadDependency:
-        def __init__(self, a):
-            pass
+def test_override_subclass_dependency():
+    d = OverwriteDependent(abstract_dependency='test')
+    assert d.abstract_dependency == 'test'
+
 
+def test_override_base_class_dependency():
     @inject
-    class D:
-        _: BadDependency
+    class C(AbstractDependent):
+        some_dependency: SomeDependency
 
-    pytest.raises(InjectionError, lambda: D()._)
+    d = C(abstract_dependency='test')
+    assert d.abstract_dependency == 'test'
+    assert isinstance(d.some_dependency, SomeDependency)
 
 
-def test_subtype_is_bad_dependency():
-    @dependency
-    class D:
-        pass
+def test_inject_class_with_getattr():
+    @inject
+    class C:
+        d: SomeDependency
 
-    class BadDependency(D):
+        def __getattr__(self, item):
+            return 'fallback'
+
+    assert isinstance(C().d, SomeDependency)
+
+
+def test_inject_class_with_slots():
+    @inject
+    class C:
+        __slots__ = ('_C__d',)
+        d: SomeDependency
+
+    assert isinstance(C().d, SomeDependency)
+
+
+def test_override_base_class_dependency_with_slots():
+    @inject
+    class B:
+        __slots__ = ('_B__d',)
+        d: SomeDependency
+
+    @inject
+    class C(B):
+        __slots__ = ('_C__e',)
+        e: SomeDependency
+
+    assert C(d='test').d == 'test'
+
+
+def _init_takes_argument():
+    @dependency
+    class BadDependency:
         def __init__(self, a):
             pass
 
     @inject
     class C:
-        _: D
-
-    with Context(BadDependency):
-        pytest.raises(InjectionError, lambda: C()._)
+        _: BadDependency
+    return C
 
 
-def test_dependency_raises_type_error():
+def _init_raises_type_error():
     @dependency
     class BadDependency:
         def __init__(self):
@@ -247,27 +291,31 @@ def test_dependency_raises_type_error():
     @inject
     class C:
         _: BadDependency
+    return C
 
-    pytest.raises(InjectionError, lambda: C()._)
 
+def _set_attr_override():
+    @dependency
+    class D:
+        pass
 
-def test_no_named_dependency():
     @inject
     class C:
-        name: str
+        _: D
 
-    pytest.raises(NoNamedDependency, lambda: C().name)
+        def __setattr__(self, key, value):
+            raise AttributeError()
+    return C
 
 
-def test_no_dependencies():
+def _no_named_dependency():
     @inject
     class C:
-        pass
-
-    assert isinstance(C(), C)
+        _: str
+    return C
 
 
-def test_missing_init_dependencies():
+def _missing_init_dependencies():
     class D:
         @inject
         def __init__(self, a):
@@ -275,24 +323,134 @@ def test_missing_init_dependencies():
 
     @inject
     class C:
-        d: D
+        _: D
+    return C
+
 
-    pytest.raises(NoNamedDependency, lambda: C().d)
+_ERROR_CASES = [
+    pytest.param(_init_takes_argument(), InjectionError,
+                 id='init_takes_argument'),
+    pytest.param(_init_raises_type_error(), InjectionError,
+                 id='init_raises_type_error'),
+    pytest.param(_set_attr_override(), InjectionError,
+                 id='set_attr_override'),
+    pytest.param(_no_named_dependency(), NoNamedDependency,
+                 id='no_named_dependency'),
+    pytest.param(_missing_init_dependencies(), NoNamedDependency,
+                 id='missing_init_dependencies'),
+]
 
 
-def test_inject_with_set_attr_override():
+@pytest.mark.parametrize('dependent,exception', _ERROR_CASES)
+def test_injection_errors(dependent, exception):
+    with pytest.raises(exception):
+        dependent()._
+
+
+def test_subtype_is_bad_dependency():
     @dependency
     class D:
         pass
 
+    class BadDependency(D):
+        def __init__(self, a):
+            pass
+
     @inject
     class C:
-        d: D
+        _: D
+
+    with Context(BadDependency):
+        pytest.raises(InjectionError, lambda: C()._)
+
+
+def test_init_is_generated_on_first_instantiation():
+    @inject
+    class C:
+        d: SomeDependency
+
+    lazy_init = C.__init__
+    C()
+    assert C.__init__ is not lazy_init
+    assert isinstance(C().d, SomeDependency)
+
+
+def test_init_placeholder_delegates_once_generated():
+    @inject
+    class C:
+        d: SomeDependency
+
+    @inject
+    class Sub(C):
+        e: SomeDependency
+
+    placeholder = C.__init__
+    assert isinstance(C().d, SomeDependency)
+    assert C.__init__ is not placeholder
+
+    c = C.__new__(C)
+    placeholder(c)
+    assert isinstance(c.d, SomeDependency)
+
+    # Sub keeps calling the placeholder as its base __init__, which must
+    # not wait for the lock guarding the generation anymore
+    lock, = [cell.cell_contents for cell in placeholder.__closure__
+             if isinstance(cell.cell_contents, type(threading.Lock()))]
+    subs = []
+    with lock:
+        thread = threading.Thread(target=lambda: subs.append(Sub()))
+        thread.start()
+        thread.join(timeout=5)
+        assert len(subs) == 1
+    assert isinstance(subs[0].d, SomeDependency)
+    assert isinstance(subs[0].e, SomeDependency)
+
+
+def test_init_is_generated_once_for_concurrent_instantiation():
+    @inject
+    class C:
+        d: SomeDependency
+
+    placeholder = C.__init__
+    lock, = [cell.cell_contents for cell in placeholder.__closure__
+             if isinstance(cell.cell_contents, type(threading.Lock()))]
+    instances = []
+    with lock:
+        threads = [threading.Thread(target=lambda: instances.append(C()))
+                   for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        # wait until both threads are blocked on the lock in the placeholder
+        while not all(
+                sys._current_frames()[thread.ident].f_code is
+                placeholder.__code__ for thread in threads):
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join(timeout=5)
+    assert len(instances) == 2
+    assert all(isinstance(c.d, SomeDependency) for c in instances)
+    assert C.__init__ is not placeholder
+
+
+def test_no_dependencies():
+    @inject
+    class C:
+        pass
+
+    assert isinstance(C(), C)
+
+
+def test_inject_base_class_dependency_with_set_attr_override():
+    @inject
+    class C(AbstractDependent):
+        some_dependency: SomeDependency
 
         def __setattr__(self, key, value):
-            raise AttributeError()
+            if key.endswith('abstract_dependency'):
+                raise AttributeError()
+            super().__setattr__(key, value)
 
-    pytest.raises(InjectionError, lambda: C().d)
+    pytest.raises(InjectionError, C)
 
 
 def test_dependency_error_in_function():
@@ -354,6 +512,32 @@ def test_inject_with_return_annotation():
 
     with Context(a=1):
         assert f() == 1
+    assert f.__annotations__['return'] is int
+
+
+def test_inject_function_with_var_keyword_arguments():
+    @inject
+    def f(a, **kwargs):
+        return a, kwargs
+
+    with Context(a='a'):
+        assert f(b='b') == ('a', {'b': 'b'})
+
+
+def test_inject_function_with_partially_supplied_arguments():
+    @inject
+    def f(a: SomeDependency, b):
+        return a, b
+
+    with Context(b='b'):
+        assert f('a') == ('a', 'b')
+
+
+def test_decorate_function_with_no_parameters():
+    def f():
+        pass
+
+    assert inject(f) is f
 
 
 def test_inject_singleton_without_context():
@@ -1,4 +1,5 @@
 import sys
+import pytest
 from serum import Context, load_ipython_extension, unload_ipython_extension
 
 
@@ -6,17 +7,21 @@ class MockIpythonContext:
     context = Context()
 
 
+@pytest.fixture()
+def ipython_context(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'ipython_context', MockIpythonContext)
+    return MockIpythonContext
+
+
 def test_load_extension_no_ipython_environment():
     assert load_ipython_extension(None) is None
 
 
-def test_load_extension():
-    sys.modules['ipython_context'] = MockIpythonContext
+def test_load_extension(ipython_context):
     load_ipython_extension(None)
-    assert MockIpythonContext.context is Context.current_context()
+    assert ipython_context.context is Context.current_context()
     unload_ipython_extension(None)
-    assert MockIpythonContext is not Context.current_context()
-    sys.modules['ipython_context'] = None
+    assert ipython_context.context is not Context.current_context()
 
 
 def test_unload_extension_no_ipython_environment():
@@ -0,0 +1,16 @@
+import copy
+import pickle
+
+from serum._key import Key
+
+
+def test_key_can_be_copied():
+    key = Key(dependency_type=str, name='key')
+    assert copy.copy(key) == key
+    assert copy.deepcopy(key) == key
+    assert pickle.loads(pickle.dumps(key)) == key
+
+
+def test_key_repr():
+    key = Key(dependency_type=str, name='key')
+    assert repr(key) == "Key(dependency_type=<class 'str'>, name='key')"
@@ -4,6 +4,10 @@ from serum import Context, match
 from serum.exceptions import UnknownEnvironment
 import pytest
 
+_ENV1 = Context()
+_ENV2 = Context()
+_DEFAULT = Context()
+
 
 @pytest.fixture()
 def environ():
@@ -12,27 +16,22 @@ def environ():
 
 
 def test_match_returns_correct_env(environ):
-    env1 = Context()
-    env2 = Context()
     environ['TEST_ENV'] = 'ENV1'
-    env = match(environment_variable='TEST_ENV', ENV1=env1, ENV2=env2)
-    assert env is env1
+    env = match(environment_variable='TEST_ENV', ENV1=_ENV1, ENV2=_ENV2)
+    assert env is _ENV1
     environ['TEST_ENV'] = 'ENV2'
-    env = match(environment_variable='TEST_ENV', ENV1=env1, ENV2=env2)
-    assert env is env2
+    env = match(environment_variable='TEST_ENV', ENV1=_ENV1, ENV2=_ENV2)
+    assert env is _ENV2
 
 
 def test_match_gets_default():
-    default = Context()
-    env1 = Context()
-    env = match(environment_variable='TEST_ENV', default=default, ENV1=env1)
-    assert env is default
+    env = match(environment_variable='TEST_ENV', default=_DEFAULT, ENV1=_ENV1)
+    assert env is _DEFAULT
 
 
 def test_match_fails_when_no_default_and_no_env():
-    env1 = Context()
     with pytest.raises(UnknownEnvironment):
-        match(environment_variable='TEST_ENV', env1=env1)
+        match(environment_variable='TEST_ENV', env1=_ENV1)
 
 
 def test_match_fails_with_unknown_environment(environ):
@@ -44,17 +44,30 @@ def test_mocks_are_reset_after_context_exit():
     with Context():
         d = Dependent()
         assert some_component_mock is not d.some_component
-        assert isinstance(d.some_component, SomeComponent)
+        assert type(d.some_component) is SomeComponent
 
 
-def test_mock_is_specced():
+@pytest.mark.parametrize(
+    'component',
+    [SomeComponent, SomeCallableComponent]
+)
+def test_mock_is_specced(component):
     with Context():
-        some_component_mock = mock(SomeComponent)
-        assert isinstance(some_component_mock, SomeComponent)
+        component_mock = mock(component)
+        assert isinstance(component_mock, component)
         with pytest.raises(AttributeError):
-            some_component_mock.bad_method()
+            component_mock.bad_method()
+
+
+def test_mock_of_non_callable_is_not_callable():
+    with Context():
+        some_component_mock = mock(SomeComponent)
         with pytest.raises(TypeError):
             some_component_mock()
+
+
+def test_mock_of_callable_is_callable():
+    with Context():
         some_callable_component = mock(SomeCallableComponent)
         some_callable_component.return_value = 'mocked value'
         assert some_callable_component() == 'mocked value'